@@ -318,11 +318,14 @@ class Tasks(commands.Cog):
     async def before_monitor_youtube_videos(self) -> None:
         """Called before the task loop starts"""
         logger.info("monitor_youtube_videos task is starting up...")
-        for feed_name, feed_url in config.YOUTUBE_FEEDS.items():
-            logger.info("Initializing YouTube feed parser for %s", feed_name)
-            self.youtube_feeds[feed_name] = youtube.YoutubeFeedParser(
-                feed_name.lower(), feed_url
-            )
+        feeds: dict[str, str] = dict(config.YOUTUBE_FEEDS.items())
+        logger.info("Initializing YouTube feed parsers for %s", ", ".join(feeds))
+        # Fetch all feeds in parallel rather than one after another
+        parsers = youtube.YoutubeFeedParser.bulk_create(
+            {feed_name.lower(): feed_url for feed_name, feed_url in feeds.items()}
+        )
+        for feed_name in feeds:
+            self.youtube_feeds[feed_name] = parsers[feed_name.lower()]
             logger.info("Initialized YouTube feed parser for %s", feed_name)
         logger.info("Initialized %d YouTube video monitors", len(self.youtube_feeds))
         await self.bot.wait_until_ready()
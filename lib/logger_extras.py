@@ -149,6 +149,12 @@ class AccessLogFormatter(AccessFormatter):
         "5xx": "bold_red",
     }
 
+    # Format fields that need colorlog: the ones it fills in ({log_color},
+    # {reset}, {red}, ...) and {status_color}, whose codes rely on its reset
+    COLOR_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"log_color", "status_color", *colorlog.escape_codes.escape_codes}
+    )
+
     def __init__(
         self,
         fmt: str | None = None,
@@ -157,37 +163,35 @@ class AccessLogFormatter(AccessFormatter):
         log_colors: dict[str, str] | None = None,
         reset: bool = True,
     ) -> None:
+        # Normalize the format string once, at startup
+        self._fmt_clean: str | None = fmt.rstrip() if fmt else fmt
         # Initialize AccessFormatter
-        fmt_clean = fmt.rstrip() if fmt else None
-        super().__init__(fmt=fmt_clean, datefmt=datefmt, style=style)
-        # Initialize colorlog.ColoredFormatter
+        super().__init__(fmt=self._fmt_clean, datefmt=datefmt, style=style)
         self.log_colors: dict[str, str] = log_colors or {}
         self.reset: bool = reset
-        self.colored_formatter: colorlog.ColoredFormatter = colorlog.ColoredFormatter(
-            fmt=fmt_clean,
-            datefmt=datefmt,
-            style=style,
-            log_colors=log_colors,
-            reset=reset,
-        )
+        self.colored_formatter: logging.Formatter
+        # Without a format, colorlog's default one uses {log_color}
+        fmt_fields = set(re.findall(r"\w+", self._fmt_clean or "log_color"))
+        if not self.log_colors and not fmt_fields & self.COLOR_FIELDS:
+            # No colors configured or referenced - skip the colorlog layer
+            self.colored_formatter = logging.Formatter(
+                fmt=self._fmt_clean, datefmt=datefmt, style=style
+            )
+        else:
+            # Initialize colorlog.ColoredFormatter
+            self.colored_formatter = colorlog.ColoredFormatter(
+                fmt=self._fmt_clean,
+                datefmt=datefmt,
+                style=style,
+                log_colors=log_colors,
+                reset=reset,
+            )
 
     def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
         # Cast `record` to `CustomLogRecord` if required
         if isinstance(record, CustomLogRecord):
-            if record.args is None and isinstance(record.msg, str):
-                match = self.LOG_PATTERN.match(record.msg)
-                if match:
-                    record.client_addr = match.group("client_addr")
-                    record.method = match.group("method")
-                    record.path = match.group("path")
-                    record.http_version = match.group("http_version")
-                    record.status_code = int(match.group("status_code"))
-                else:
-                    # Fallback defaults if the regex fails
-                    record.client_addr = "unknown"
-                    record.method = "unknown"
-                    record.path = "unknown"
-                    record.http_version = "1.1"
+            if record.args is None:
+                self._parse_access_line(record)
 
             # Only assign additional attrs if we have a status_code
             if isinstance(record.status_code, int):
@@ -199,6 +203,27 @@ class AccessLogFormatter(AccessFormatter):
 
         return self.colored_formatter.format(record)
 
+    def _parse_access_line(self, record: CustomLogRecord) -> None:
+        """Populate the access log attributes by parsing the record message."""
+        try:
+            # pyrefly: ignore[bad-argument-type]
+            match = self.LOG_PATTERN.match(record.msg)
+        except TypeError:
+            # Non-string messages can't be parsed - leave the record untouched
+            return
+        if match:
+            record.client_addr = match.group("client_addr")
+            record.method = match.group("method")
+            record.path = match.group("path")
+            record.http_version = match.group("http_version")
+            record.status_code = int(match.group("status_code"))
+        else:
+            # Fallback defaults if the regex fails
+            record.client_addr = "unknown"
+            record.method = "unknown"
+            record.path = "unknown"
+            record.http_version = "1.1"
+
     def get_status_color(self, status_code: int) -> str:
         """Determine the color for the status code."""
         if self.HTTP_STATUS_OK_MIN <= status_code <= self.HTTP_STATUS_OK_MAX:
@@ -230,6 +255,14 @@ class JSONFormatter(logging.Formatter):
         message = self.prepare_log_dict(record)
         return json.dumps(message, default=str)
 
+    def format_batch(self, records: list[logging.LogRecord]) -> str:
+        """
+        Format multiple records as newline-delimited JSON in a single buffer,
+        so a buffering handler can write a whole batch with one call.
+        An empty batch formats to an empty string rather than a blank line.
+        """
+        return "".join(f"{self.format(record)}\n" for record in records)
+
     def prepare_log_dict(
         self, record: logging.LogRecord
     ) -> dict[str, str | int | float]:
@@ -1,9 +1,12 @@
 """Logging library - configure logging from a yaml config file"""
 
 import atexit
+import contextlib
+import json
 import logging
 import logging.config
 import logging.handlers
+import os
 from logging import Logger
 from pathlib import Path
 from typing import Any
@@ -13,10 +16,22 @@ import yaml
 from lib import config_parser
 from lib.logger_extras import custom_log_record_factory
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it; either way
+# this is one of PyYAML's safe loaders
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 # change this to DEBUG if debugging logger initialization
 logger: Logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Parsed YAML configs are cached in the directory named by this env var (caching
+# is off when it is unset), as <yaml file name> plus this suffix
+CONFIG_CACHE_DIR_ENV = "LOGGER_CONFIG_CACHE_DIR"
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
 
 def configure_logger(file_path: str = "conf/logger.yaml") -> None:
     """Set up logging using a YAML file"""
@@ -27,22 +42,21 @@ def configure_logger(file_path: str = "conf/logger.yaml") -> None:
 
     try:
         yaml_path: Path = Path(file_path)
-        with Path.open(yaml_path, encoding="utf-8") as yaml_file:
-            try:
-                yaml_config: dict[str, Any] = yaml.safe_load(yaml_file)
-                logger.debug("Read YAML config: %s", yaml_config)
-                yaml_config_resolved = config_parser.resolve_values(yaml_config)
-                logger.debug("Resolved YAML config: %s", yaml_config_resolved)
-                logging.config.dictConfig(yaml_config_resolved)
-                logger.info("Logging configuration loaded from YAML file.")
-                logger.debug("Logging configuration: %s", yaml_config_resolved)
-            except yaml.YAMLError:
-                logger.exception("Error parsing YAML file.")
-            except (AttributeError, KeyError, TypeError, ValueError):
-                logger.exception("Error in logging configuration.")
-            else:
-                start_queue_listeners()
-                return
+        try:
+            yaml_config: dict[str, Any] = load_yaml_config(yaml_path)
+            logger.debug("Read YAML config: %s", yaml_config)
+            yaml_config_resolved = config_parser.resolve_values(yaml_config)
+            logger.debug("Resolved YAML config: %s", yaml_config_resolved)
+            logging.config.dictConfig(yaml_config_resolved)
+            logger.info("Logging configuration loaded from YAML file.")
+            logger.debug("Logging configuration: %s", yaml_config_resolved)
+        except yaml.YAMLError:
+            logger.exception("Error parsing YAML file.")
+        except (AttributeError, KeyError, TypeError, ValueError):
+            logger.exception("Error in logging configuration.")
+        else:
+            start_queue_listeners()
+            return
     except (FileNotFoundError, IsADirectoryError, OSError, PermissionError):
         logger.exception("Error reading logging configuration file.")
     # Apply basic logging as a fallback
@@ -50,21 +64,95 @@ def configure_logger(file_path: str = "conf/logger.yaml") -> None:
     logger.info("Default logging configuration applied.")
 
 
-def get_all_handlers() -> set[logging.Handler]:
+def load_yaml_config(yaml_path: Path) -> dict[str, Any]:
     """
-    Retrieve all handlers from all loggers, including the root logger.
-    Returns a set of unique handlers.
+    Load a YAML config file. When a cache directory is configured, reuse the
+    cached parse of it while the file's mtime and size still match the ones
+    recorded in the cache.
+    """
+    cache_dir = os.getenv(CONFIG_CACHE_DIR_ENV)
+    if not cache_dir:
+        return _parse_yaml_config(yaml_path)
+
+    yaml_stat = yaml_path.stat()
+    file_key = [yaml_stat.st_mtime_ns, yaml_stat.st_size]
+    cache_path = Path(cache_dir) / f"{yaml_path.name}{CONFIG_CACHE_SUFFIX}"
+
+    cached_config = _read_config_cache(cache_path, file_key)
+    if cached_config is not None:
+        return cached_config
+
+    yaml_config = _parse_yaml_config(yaml_path)
+    _write_config_cache(cache_path, file_key, yaml_config)
+    return yaml_config
+
+
+def _parse_yaml_config(yaml_path: Path) -> dict[str, Any]:
+    """Parse a YAML config file with PyYAML's safe loader."""
+    with Path.open(yaml_path, encoding="utf-8") as yaml_file:
+        # _Loader is always CSafeLoader or SafeLoader (see above), which bandit
+        # cannot tell from the alias
+        yaml_config: dict[str, Any] = yaml.load(yaml_file, Loader=_Loader)  # nosec B506
+    return yaml_config
+
+
+def _read_config_cache(cache_path: Path, file_key: list[int]) -> dict[str, Any] | None:
+    """Return the cached config, or None if the cache is missing or stale."""
+    try:
+        with Path.open(cache_path, encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+        if cache["key"] != file_key:
+            return None
+        return cache["config"]
+    except (OSError, KeyError, TypeError, ValueError):
+        # Missing, unreadable, or malformed cache - re-parse the YAML instead
+        return None
+
+
+def _write_config_cache(
+    cache_path: Path, file_key: list[int], config: dict[str, Any]
+) -> None:
+    """
+    Atomically write the parsed config to the cache file. Configs that don't
+    survive a JSON round trip unchanged (e.g. dates or non-string keys) are
+    not cached, so a cache hit always yields the same dict as a fresh parse.
     """
-    # Start with the root logger
-    all_handlers: set[logging.Handler] = set(logging.root.handlers)
+    try:
+        cache_text = json.dumps({"key": file_key, "config": config})
+    except (TypeError, ValueError):
+        return
+    if json.loads(cache_text)["config"] != config:
+        return
+
+    tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+    try:
+        with Path.open(tmp_path, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(cache_text)
+        tmp_path.replace(cache_path)
+    except OSError:
+        # Caching is best-effort (e.g. a missing or read-only cache directory)
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
 
-    # Add handlers from all other loggers
-    for logger_obj in logging.Logger.manager.loggerDict.values():
-        if isinstance(logger_obj, logging.Logger):
-            all_handlers.update(logger_obj.handlers)
 
-    # Return the unique set of handlers
-    return all_handlers
+def get_all_handlers() -> list[logging.Handler]:
+    """
+    Retrieve all handlers from all loggers, including the root logger.
+    Returns a list of unique handlers.
+    """
+    # Start with the root logger, then add handlers from all other loggers
+    all_handlers: list[logging.Handler] = [
+        *logging.root.handlers,
+        *(
+            handler
+            for logger_obj in logging.Logger.manager.loggerDict.values()
+            if isinstance(logger_obj, logging.Logger)
+            for handler in logger_obj.handlers
+        ),
+    ]
+
+    # Drop duplicates (shared handlers), keeping first-seen order
+    return list(dict.fromkeys(all_handlers))
 
 
 def start_queue_listeners() -> None:
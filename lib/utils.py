@@ -5,6 +5,7 @@ from logging import Logger
 # TODO @cyberops7: move PORT_MIN/MAX to config
 PORT_MIN = 0
 PORT_MAX = 65535
+_VALID_PORTS = range(PORT_MIN, PORT_MAX + 1)
 
 logger: Logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ def ensure_valid_port(port: int) -> int:
     if not isinstance(port, int):
         msg = f"Port must be an integer, but got {type(port).__name__}: {port}"
         raise TypeError(msg)
-    if not (PORT_MIN <= port <= PORT_MAX):
+    if port not in _VALID_PORTS:
         msg = f"Port {port} is not in the valid range {PORT_MIN}-{PORT_MAX}"
         raise ValueError(msg)
     return port
@@ -2,18 +2,96 @@ import logging
 import socket
 import time
 import urllib.error
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, MutableSet
+from concurrent.futures import ThreadPoolExecutor
+from typing import Self
 
 import feedparser
 from feedparser import FeedParserDict
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Far more than the ~15 entries a YouTube feed holds, so an ID is only evicted
+# long after it has dropped out of the feed
+SEEN_VIDEOS_MAXLEN = 2048
+
+
+class _BoundedSet(MutableSet[str]):
+    """
+    Insertion-ordered set that evicts its oldest item once it holds more than
+    `maxlen`, so a long-running monitor's seen videos don't grow without bound
+    """
+
+    __slots__ = ("_items", "_maxlen")
+
+    def __init__(
+        self, items: Iterable[str] = (), maxlen: int = SEEN_VIDEOS_MAXLEN
+    ) -> None:
+        self._items: OrderedDict[str, None] = OrderedDict()
+        self._maxlen: int = maxlen
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._items)!r}, maxlen={self._maxlen})"
+
+    def add(self, value: str) -> None:
+        if value in self._items:
+            self._items.move_to_end(value)
+            return
+        self._items[value] = None
+        if len(self._items) > self._maxlen:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def discard(self, value: str) -> None:
+        self._items.pop(value, None)
+
 
 class YoutubeFeedParser:
-    def __init__(self, feed_name: str, feed_url: str) -> None:
+    def __init__(
+        self, feed_name: str, feed_url: str, initial_data: bytes | None = None
+    ) -> None:
         self.feed_name: str = feed_name
         self.feed_url: str = feed_url
-        self.seen_videos: set[str] = self._initialize_seen_videos()
+        self.seen_videos: MutableSet[str] = _BoundedSet(
+            self._initialize_seen_videos(initial_data)
+        )
+
+    @classmethod
+    def bulk_create(
+        cls, feeds: Mapping[str, str], max_workers: int | None = None
+    ) -> dict[str, Self]:
+        """
+        Create a parser for each feed, fetching the feeds in parallel since
+        each parser blocks on the network while initializing its seen videos.
+
+        Args:
+            feeds: Mapping of feed name to feed URL
+            max_workers: Maximum number of threads (ThreadPoolExecutor default
+                if None)
+
+        Returns:
+            Mapping of feed name to its initialized parser
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                feed_name: executor.submit(cls, feed_name, feed_url)
+                for feed_name, feed_url in feeds.items()
+            }
+        return {feed_name: future.result() for feed_name, future in futures.items()}
 
     @staticmethod
     def get_thumbnail_from_entry(entry: FeedParserDict) -> str | None:
@@ -85,6 +163,7 @@ class YoutubeFeedParser:
         max_retries: int,
         retry_delay: int,
         current_videos: set[str],
+        source: bytes | str,
     ) -> tuple[bool, int]:
         """
         Attempt to fetch and process feed entries.
@@ -94,6 +173,7 @@ class YoutubeFeedParser:
             max_retries: Maximum number of retry attempts
             retry_delay: Current retry delay in seconds
             current_videos: Set to add video IDs to
+            source: Already-downloaded feed bytes, or the URL to fetch
 
         Returns:
             Tuple of (success, new_retry_delay)
@@ -101,7 +181,7 @@ class YoutubeFeedParser:
             - new_retry_delay: Updated retry delay (doubled if retry needed)
         """
         try:
-            feed = feedparser.parse(self.feed_url)
+            feed = feedparser.parse(source)
             logger.debug("Loaded RSS feed for %s: %s", self.feed_name, feed)
 
             # If bozo and no entries, it might be a transient issue - retry
@@ -167,21 +247,27 @@ class YoutubeFeedParser:
         logger.exception("%s initializing RSS feed seen videos", error_type)
         return False
 
-    def _initialize_seen_videos(self) -> set[str]:
+    def _initialize_seen_videos(self, initial_data: bytes | None = None) -> set[str]:
         """
-        Initialize seen videos by loading current feed entries with retry logic
+        Initialize seen videos by loading current feed entries with retry logic.
+
+        Args:
+            initial_data: Already-downloaded feed bytes to parse instead of
+                fetching feed_url (parsed once, without retries)
         """
         # Load current feed entries as "already seen"
         logger.debug(
             "Initializing seen videos for %s (%s)", self.feed_name, self.feed_url
         )
         current_videos = set()
-        max_retries = 3
+        source = self.feed_url if initial_data is None else initial_data
+        # Retrying only helps with transient network issues
+        max_retries = 3 if initial_data is None else 1
         retry_delay = 1  # seconds
 
         for attempt in range(max_retries):
             success, retry_delay = self._attempt_feed_fetch(
-                attempt, max_retries, retry_delay, current_videos
+                attempt, max_retries, retry_delay, current_videos, source
             )
             if success:
                 break
@@ -7,14 +7,12 @@ import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import discord
-import feedparser
 import pytest
-from feedparser import FeedParserDict
 from pytest_mock import MockerFixture
 
 from lib.bot import DiscordBot
 from lib.cogs.tasks import Tasks
-from tests.utils import async_test
+from tests.utils import async_test, make_entry
 
 
 @pytest.fixture
@@ -888,29 +886,21 @@ class TestTasks:
     ) -> None:
         """Test the monitor_youtube_videos method when new videos are found"""
         # Mock feed parser with new videos
-        video1 = FeedParserDict(
-            {
-                "id": "yt:video:abcdef123",
-                "link": "https://www.youtube.com/watch?v=abcdef123",
-                "yt_videoid": "abcdef123",
-                "title": "Test Video 1",
-                "author": "Test Author 1",
-                "published": "2025-10-20T12:00:00+00:00",
-                "summary": "Test Summary 1\nOther summary stuff",
-            }
+        video1 = make_entry(
+            "abcdef123",
+            title="Test Video 1",
+            author="Test Author 1",
+            published="2025-10-20T12:00:00+00:00",
+            summary="Test Summary 1\nOther summary stuff",
         )
 
         # noinspection SpellCheckingInspection
-        video2 = FeedParserDict(
-            {
-                "id": "yt:video:ghijkl456",
-                "link": "https://www.youtube.com/watch?v=abcdef123",
-                "yt_videoid": "abcdef123",
-                "title": "Test Video 2",
-                "author": "Test Author 2",
-                "published": "2025-10-20T12:00:00+00:00",
-                "summary": "Test Summary 2\nOther summary stuff",
-            }
+        video2 = make_entry(
+            "ghijkl456",
+            title="Test Video 2",
+            author="Test Author 2",
+            published="2025-10-20T12:00:00+00:00",
+            summary="Test Summary 2\nOther summary stuff",
         )
 
         mock_feed_parser = MagicMock()
@@ -983,16 +973,12 @@ class TestTasks:
         mock_config.DRY_RUN_YOUTUBE = False
 
         # Mock feed parser with new videos
-        video1 = FeedParserDict(
-            {
-                "id": "yt:video:abcdef123",
-                "link": "https://www.youtube.com/watch?v=abcdef123",
-                "yt_videoid": "abcdef123",
-                "title": "Test Video 1",
-                "author": "Test Author",
-                "published": "2025-10-20T12:00:00+00:00",
-                "summary": "Test Summary\nOther summary stuff",
-            }
+        video1 = make_entry(
+            "abcdef123",
+            title="Test Video 1",
+            author="Test Author",
+            published="2025-10-20T12:00:00+00:00",
+            summary="Test Summary\nOther summary stuff",
         )
         mock_feed_parser = MagicMock()
         mock_feed_parser.get_new_videos.return_value = [video1]
@@ -1146,10 +1132,13 @@ class TestTasks:
         tasks_cog: Tasks,
     ) -> None:
         """Test before_monitor_youtube_videos method"""
-        # Mock YouTube feed parser
+        # Mock YouTube feed parser; one parser per feed, handed back in reverse
+        # order so parsers must be matched to feeds by name, not by position
+        mock_parsers = {"jims_garage": MagicMock(), "tech_bench": MagicMock()}
         with patch("lib.cogs.tasks.youtube.YoutubeFeedParser") as mock_parser_class:
-            mock_parser_instance = MagicMock()
-            mock_parser_class.return_value = mock_parser_instance
+            mock_parser_class.bulk_create.side_effect = lambda feeds: {
+                feed_name: mock_parsers[feed_name] for feed_name in reversed(feeds)
+            }
             tasks_cog.bot.wait_until_ready = AsyncMock()
 
             mock_config.DRY_RUN_YOUTUBE = False
@@ -1176,20 +1165,19 @@ class TestTasks:
             for record in info_records
         )
 
-        # Verify YouTube feed parsers were created with correct feeds from mock config
-        assert mock_parser_class.call_count == 2
-        mock_parser_class.assert_any_call(
-            "jims_garage",
-            "https://www.youtube.com/feeds/videos.xml?channel_id=UCUUTdohVElFLSP4NBnlPEwA",
-        )
-        mock_parser_class.assert_any_call(
-            "tech_bench",
-            "https://www.youtube.com/feeds/videos.xml?channel_id=UCT5B7jBug46N7abnl_izt5w",
+        # Verify YouTube feed parsers were created together from mock config feeds
+        mock_parser_class.bulk_create.assert_called_once_with(
+            {
+                "jims_garage": "https://www.youtube.com/feeds/videos.xml?channel_id=UCUUTdohVElFLSP4NBnlPEwA",
+                "tech_bench": "https://www.youtube.com/feeds/videos.xml?channel_id=UCT5B7jBug46N7abnl_izt5w",
+            }
         )
 
         # Verify feeds were stored with correct names
-        assert "JIMS_GARAGE" in tasks_cog.youtube_feeds
-        assert "TECH_BENCH" in tasks_cog.youtube_feeds
+        assert tasks_cog.youtube_feeds == {
+            "JIMS_GARAGE": mock_parsers["jims_garage"],
+            "TECH_BENCH": mock_parsers["tech_bench"],
+        }
 
         # Verify bot wait_until_ready was called
         tasks_cog.bot.wait_until_ready.assert_called_once()
@@ -1205,19 +1193,19 @@ class TestTasks:
         Test before_monitor_youtube_videos method with
         DRY_RUN_YOUTUBE=True
         """
-        # Create a mock video entry that supports attribute access
-        video1 = MagicMock(spec=feedparser.FeedParserDict)
-        video1.id = "yt:video:abcdef123"
-        video1.link = "https://www.youtube.com/watch?v=abcdef123"
-        video1.yt_videoid = "abcdef123"
-        video1.title = "Test Video 1"
-        video1.author = "Test Author"
-        video1.published = "2025-10-20T12:00:00+00:00"
-        video1.summary = "Test Summary\nOther summary stuff"
+        video1 = make_entry(
+            "abcdef123",
+            title="Test Video 1",
+            author="Test Author",
+            published="2025-10-20T12:00:00+00:00",
+            summary="Test Summary\nOther summary stuff",
+        )
 
         with patch("lib.cogs.tasks.youtube.YoutubeFeedParser") as mock_parser_class:
             mock_parser_instance = MagicMock()
-            mock_parser_class.return_value = mock_parser_instance
+            mock_parser_class.bulk_create.side_effect = lambda feeds: dict.fromkeys(
+                feeds, mock_parser_instance
+            )
             mock_parser_instance.get_latest_video.return_value = video1
             tasks_cog.bot.wait_until_ready = AsyncMock()
 
@@ -1251,7 +1239,9 @@ class TestTasks:
         """
         with patch("lib.cogs.tasks.youtube.YoutubeFeedParser") as mock_parser_class:
             mock_parser_instance = MagicMock()
-            mock_parser_class.return_value = mock_parser_instance
+            mock_parser_class.bulk_create.side_effect = lambda feeds: dict.fromkeys(
+                feeds, mock_parser_instance
+            )
             tasks_cog.bot.wait_until_ready = AsyncMock()
 
             mock_config.DRY_RUN_YOUTUBE = True
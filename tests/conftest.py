@@ -9,6 +9,7 @@ import pytest
 from discord import Intents
 
 from lib.bot import DiscordBot
+from lib.youtube import YoutubeFeedParser
 
 
 def create_mock_user(name: str, user_id: int) -> MagicMock:
@@ -135,6 +136,17 @@ def mock_config(
     Config._config_data = original_config_data
 
 
+@pytest.fixture(scope="session")
+def real_youtube_parsers() -> dict[str, YoutubeFeedParser]:
+    """
+    YoutubeFeedParser for each feed in the real config, fetched once per
+    session since every parser hits the network on init
+    """
+    from lib.config import config  # noqa: PLC0415 imports at the top of the file
+
+    return YoutubeFeedParser.bulk_create(dict(config.YOUTUBE_FEEDS.items()))
+
+
 @pytest.fixture
 def mock_guild(mock_config: MagicMock) -> MagicMock:
     """Mock discord.Guild fixture"""
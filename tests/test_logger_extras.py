@@ -301,11 +301,66 @@ class TestAccessLogFormatter:
         formatter = AccessLogFormatter(fmt=None)
         assert isinstance(formatter.colored_formatter, colorlog.ColoredFormatter)
 
+    def test_format_with_fmt_none(self) -> None:
+        """Test that fmt=None keeps colorlog's default colored format"""
+        formatter = AccessLogFormatter(fmt=None)
+        record = logging.LogRecord(
+            name="uvicorn.access",
+            level=logging.INFO,
+            pathname="/test/path.py",
+            lineno=42,
+            msg="hello",
+            args=(),
+            exc_info=None,
+        )
+
+        green = colorlog.escape_codes.escape_codes["green"]
+        reset = colorlog.escape_codes.escape_codes["reset"]
+        assert formatter.format(record) == f"{green}INFO:uvicorn.access:hello{reset}"
+
     def test_init_with_fmt_trailing_whitespace(self) -> None:
         """Test AccessLogFormatter initialization strips trailing whitespace"""
         formatter = AccessLogFormatter(fmt="{message}   ")
         # This tests that fmt_clean is used after stripping
-        assert isinstance(formatter.colored_formatter, colorlog.ColoredFormatter)
+        assert isinstance(formatter.colored_formatter, logging.Formatter)
+        assert formatter._fmt_clean == "{message}"
+
+    def test_format_without_log_colors(self) -> None:
+        """Test that a formatter without log_colors emits no ANSI codes"""
+        formatter = AccessLogFormatter(fmt="{levelname} - {message}")
+        record = logging.LogRecord(
+            name="test_logger",
+            level=logging.INFO,
+            pathname="/test/path.py",
+            lineno=42,
+            msg="Test message",
+            args=(),
+            exc_info=None,
+        )
+
+        assert not isinstance(formatter.colored_formatter, colorlog.ColoredFormatter)
+        assert formatter.formatMessage(record) == "INFO - Test message"
+
+    def test_format_color_fields_without_log_colors(self) -> None:
+        """Test that a format using colorlog fields keeps colorlog's default colors"""
+        formatter = AccessLogFormatter(
+            fmt="[{log_color}{levelname}{reset}] {method} {path} "
+            "{status_color}{status_code}{reset}",
+        )
+        record = CustomLogRecord(
+            name="uvicorn.access",
+            level=logging.INFO,
+            pathname="/test/path.py",
+            lineno=42,
+            msg='127.0.0.1:5000 - "GET /items HTTP/1.1" 200',
+            args=None,
+        )
+
+        green = colorlog.escape_codes.escape_codes["green"]
+        reset = colorlog.escape_codes.escape_codes["reset"]
+        assert formatter.formatMessage(record) == (
+            f"[{green}INFO{reset}] GET /items {green}200{reset}"
+        )
 
     @pytest.mark.parametrize(
         ("status_code", "expected_color_key"),
@@ -695,6 +750,30 @@ class TestJSONFormatter:
         assert data["msg"] == "Test message"
         assert data["message"] == "Test message"  # Always present
 
+    def test_format_batch(self, formatter: JSONFormatter) -> None:
+        """Test format_batch joins formatted records with newlines"""
+        records = [
+            logging.LogRecord(
+                name="test_logger",
+                level=logging.INFO,
+                pathname="/test/path.py",
+                lineno=42,
+                msg=f"Test message {i}",
+                args=(),
+                exc_info=None,
+            )
+            for i in range(2)
+        ]
+
+        result = formatter.format_batch(records)
+        lines = result.splitlines()
+
+        assert result.endswith("\n")
+        assert len(lines) == 2
+        assert json.loads(lines[0])["message"] == "Test message 0"
+        assert json.loads(lines[1])["message"] == "Test message 1"
+        assert formatter.format_batch([]) == ""
+
     def test_format_with_fmt_keys_missing_attribute(self) -> None:
         """Test format method with fmt_keys referencing a missing attribute"""
         formatter = JSONFormatter(fmt_keys={"missing": "nonexistent_attr"})
@@ -1,17 +1,28 @@
 """Unit tests for logger_setup.py"""
 
+import datetime as dt
+import importlib
+import json
 import logging
+import os
+from collections.abc import Generator
 from logging.handlers import QueueListener
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, cast
-from unittest.mock import ANY, AsyncMock, MagicMock, Mock, NonCallableMagicMock
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 import yaml
 from pytest_mock import MockerFixture
 
+from lib import logger_setup
 from lib.logger_setup import (
+    CONFIG_CACHE_DIR_ENV,
+    CONFIG_CACHE_SUFFIX,
     configure_logger,
     get_all_handlers,
+    load_yaml_config,
     start_queue_listeners,
 )
 
@@ -28,11 +39,29 @@ class MockQueueHandler(logging.Handler):
         self.listener = listener
 
 
+@pytest.fixture(autouse=True)
+def mock_logger() -> Generator[MagicMock, None, None]:  # noqa: UP043 unnecessary default type args
+    with patch("lib.logger_setup.logger") as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def shared_queue_handler() -> MockQueueHandler:
+    """Build the queue handler once per module; `logging.Handler` setup isn't free"""
+    return MockQueueHandler(name="queue_handler", listener=Mock())
+
+
 @pytest.fixture
-def mock_logger(
-    mocker: MockerFixture,
-) -> MagicMock | AsyncMock | NonCallableMagicMock:
-    return mocker.patch("lib.logger_setup.logger")
+def queue_handler(shared_queue_handler: MockQueueHandler) -> MockQueueHandler:
+    """Hand out the shared queue handler with a clean listener mock"""
+    cast("Mock", shared_queue_handler.listener).reset_mock()
+    return shared_queue_handler
+
+
+@pytest.fixture(scope="module")
+def queue_handler_no_listener() -> MockQueueHandler:
+    """Shared queue handler without a listener, for the no-listener path"""
+    return MockQueueHandler(name="queue_handler", listener=None)
 
 
 @pytest.fixture
@@ -69,8 +98,14 @@ def test_configure_logger(
         with open(yaml_file, "w") as f:
         yaml.dump(mock_yaml_config, f)
     """
-    mock_path = mocker.patch("lib.logger_setup.Path", return_value=MagicMock())
-    mocker.patch("yaml.safe_load", return_value=mock_yaml_config)
+    # Keep the config cache out of the way; it has its own tests below
+    mocker.patch.dict(os.environ, {CONFIG_CACHE_DIR_ENV: ""})
+    mock_read_cache = mocker.patch("lib.logger_setup._read_config_cache")
+    mock_write_cache = mocker.patch("lib.logger_setup._write_config_cache")
+    mock_path = mocker.patch("lib.logger_setup.Path")
+    # A file-handle mock is all Path.open needs to hand back
+    mock_path.open = mocker.mock_open()
+    mocker.patch("lib.logger_setup.yaml.load", return_value=mock_yaml_config)
 
     configure_logger(".tmp/logger.yaml")
 
@@ -86,100 +121,246 @@ def test_configure_logger(
     assert mock_logger.info.call_count == 3
     mock_logger.assert_has_calls(expected_calls, any_order=False)
     mock_path.assert_called_once()
+    mock_path.open.assert_any_call(mock_path.return_value, encoding="utf-8")
+    mock_read_cache.assert_not_called()
+    mock_write_cache.assert_not_called()
+
+
+@pytest.fixture(scope="class")
+def configure_logger_mocks(class_mocker: MockerFixture) -> SimpleNamespace:
+    """Patch the collaborators of configure_logger once per test class"""
+    # Keep the config cache out of the way; it has its own tests below
+    class_mocker.patch.dict(os.environ, {CONFIG_CACHE_DIR_ENV: ""})
+    class_mocker.patch("lib.logger_setup._read_config_cache")
+    class_mocker.patch("lib.logger_setup._write_config_cache")
+    mock_path = class_mocker.patch("lib.logger_setup.Path")
+    mock_path.open = class_mocker.mock_open()
+    return SimpleNamespace(
+        path=mock_path,
+        yaml=class_mocker.patch("lib.logger_setup.yaml.load"),
+        basic=class_mocker.patch("logging.basicConfig"),
+        dict_cfg=class_mocker.patch("logging.config.dictConfig"),
+    )
 
 
-@pytest.mark.parametrize(
-    "exception",
-    [
-        FileNotFoundError,
-        IsADirectoryError,
-        OSError,
-        PermissionError,
-    ],
-)
-def test_configure_logger_outer_exceptions(
-    mocker: MockerFixture, exception: type[Exception], mock_logger: MagicMock
-) -> None:
-    mock_path = mocker.patch("lib.logger_setup.Path", side_effect=exception)
-    mock_basic_config = mocker.patch("lib.logger_setup.logging.basicConfig")
+class TestConfigureLoggerExceptions:
+    @pytest.fixture(autouse=True)
+    def reset_mocks(
+        self,
+        configure_logger_mocks: SimpleNamespace,
+        mock_yaml_config: dict[str, Any],
+    ) -> None:
+        """Clear call history left over from the previous parameter"""
+        for mock in vars(configure_logger_mocks).values():
+            mock.reset_mock()
+        configure_logger_mocks.yaml.return_value = mock_yaml_config
+
+    @pytest.mark.parametrize(
+        ("patch_target", "exception", "expected_log"),
+        [
+            ("path", FileNotFoundError, "Error reading logging configuration file."),
+            ("path", IsADirectoryError, "Error reading logging configuration file."),
+            ("path", OSError, "Error reading logging configuration file."),
+            ("path", PermissionError, "Error reading logging configuration file."),
+            ("yaml", yaml.YAMLError, "Error parsing YAML file."),
+            ("dict_cfg", AttributeError, "Error in logging configuration."),
+            ("dict_cfg", KeyError, "Error in logging configuration."),
+            ("dict_cfg", TypeError, "Error in logging configuration."),
+            ("dict_cfg", ValueError, "Error in logging configuration."),
+        ],
+        ids=[
+            "file_not_found",
+            "is_a_directory",
+            "os_error",
+            "permission_error",
+            "yaml_error",
+            "attribute_error",
+            "key_error",
+            "type_error",
+            "value_error",
+        ],
+    )
+    def test_configure_logger_exceptions(
+        self,
+        configure_logger_mocks: SimpleNamespace,
+        mock_logger: MagicMock,
+        patch_target: str,
+        exception: type[Exception],
+        expected_log: str,
+    ) -> None:
+        """Every failure path logs its error and falls back to basic logging"""
+        target = getattr(configure_logger_mocks, patch_target)
+        target.side_effect = exception
+        try:
+            configure_logger()
+        finally:
+            target.side_effect = None
+
+        mock_logger.exception.assert_called_once_with(expected_log)
+        assert mock_logger.info.mock_calls == [
+            call("Loading logging configuration from YAML file..."),
+            call("Default logging configuration applied."),
+        ]
+        configure_logger_mocks.path.assert_called_once()
+        configure_logger_mocks.basic.assert_called_once_with(level=logging.INFO)
+
+
+def test_yaml_loader_without_libyaml(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without LibYAML the module still imports, falling back to SafeLoader"""
+    monkeypatch.delattr(yaml, "CSafeLoader")
+    try:
+        assert importlib.reload(logger_setup)._Loader is yaml.SafeLoader
+    finally:
+        monkeypatch.undo()
+        importlib.reload(logger_setup)
+    assert logger_setup._Loader is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-    configure_logger()
 
-    expected_calls = [
-        mocker.call.info("Loading logging configuration from YAML file..."),
-        mocker.call.exception("Error reading logging configuration file."),
-    ]
-    mock_logger.assert_has_calls(expected_calls, any_order=False)
-    mock_path.assert_called_once()
-    mock_basic_config.assert_called_once()
+@pytest.fixture
+def yaml_file(tmp_path: Path, mock_yaml_config: dict[str, Any]) -> Path:
+    """Write the mock YAML config to a temporary file"""
+    yaml_path = tmp_path / "logger.yaml"
+    yaml_path.write_text(yaml.safe_dump(mock_yaml_config), encoding="utf-8")
+    return yaml_path
 
 
-def test_configure_logger_yaml_exception(
-    mocker: MockerFixture, mock_logger: MagicMock
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Enable the config cache in its own temporary directory"""
+    cache_path = tmp_path / "cache"
+    cache_path.mkdir()
+    monkeypatch.setenv(CONFIG_CACHE_DIR_ENV, str(cache_path))
+    return cache_path
+
+
+@pytest.mark.parametrize("env_value", [None, ""], ids=["unset", "empty"])
+def test_load_yaml_config_cache_disabled(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    yaml_file: Path,
+    mock_yaml_config: dict[str, Any],
+    env_value: str | None,
 ) -> None:
-    mock_path = mocker.patch("lib.logger_setup.Path", return_value=MagicMock())
-    mocker.patch("yaml.safe_load", side_effect=yaml.YAMLError)
-    mock_basic_config = mocker.patch("logging.basicConfig")
+    """Without a cache directory every load parses the YAML and nothing is written"""
+    if env_value is None:
+        monkeypatch.delenv(CONFIG_CACHE_DIR_ENV, raising=False)
+    else:
+        monkeypatch.setenv(CONFIG_CACHE_DIR_ENV, env_value)
+    mock_yaml_load = mocker.patch(
+        "lib.logger_setup.yaml.load", return_value=mock_yaml_config
+    )
 
-    configure_logger(".tmp/bad_logger.yaml")
+    assert load_yaml_config(yaml_file) == mock_yaml_config
+    assert load_yaml_config(yaml_file) == mock_yaml_config
+    assert mock_yaml_load.call_count == 2
+    assert [path.name for path in yaml_file.parent.iterdir()] == [yaml_file.name]
 
-    expected_calls = [
-        mocker.call.info("Loading logging configuration from YAML file..."),
-        mocker.call.exception("Error parsing YAML file."),
-        mocker.call.info("Default logging configuration applied."),
-    ]
-    mock_logger.assert_has_calls(expected_calls, any_order=False)
-    mock_path.assert_called_once()
-    mock_basic_config.assert_called_once()
+
+def test_load_yaml_config_uses_cache(
+    mocker: MockerFixture,
+    yaml_file: Path,
+    cache_dir: Path,
+    mock_yaml_config: dict[str, Any],
+) -> None:
+    """The first load writes the cache, the second load skips YAML parsing"""
+    cache_path = cache_dir / f"{yaml_file.name}{CONFIG_CACHE_SUFFIX}"
+
+    assert load_yaml_config(yaml_file) == mock_yaml_config
+    assert cache_path.exists()
+
+    mock_yaml_load = mocker.patch("lib.logger_setup.yaml.load")
+    assert load_yaml_config(yaml_file) == mock_yaml_config
+    mock_yaml_load.assert_not_called()
 
 
 @pytest.mark.parametrize(
-    "exception",
+    "cache_contents",
     [
-        AttributeError,
-        KeyError,
-        TypeError,
-        ValueError,
+        json.dumps({"key": [0, 0], "config": {"stale": True}}),  # Stale cache
+        "not json",  # Malformed cache
     ],
 )
-def test_configure_logger_inner_exceptions(
+def test_load_yaml_config_ignores_bad_cache(
+    yaml_file: Path,
+    cache_dir: Path,
+    mock_yaml_config: dict[str, Any],
+    cache_contents: str,
+) -> None:
+    """A stale or malformed cache is ignored and rewritten"""
+    cache_path = cache_dir / f"{yaml_file.name}{CONFIG_CACHE_SUFFIX}"
+    cache_path.write_text(cache_contents, encoding="utf-8")
+
+    assert load_yaml_config(yaml_file) == mock_yaml_config
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["config"] == (
+        mock_yaml_config
+    )
+
+
+def test_load_yaml_config_cache_write_error(
     mocker: MockerFixture,
-    mock_logger: MagicMock,
+    yaml_file: Path,
+    cache_dir: Path,
     mock_yaml_config: dict[str, Any],
-    exception: type[Exception],
 ) -> None:
-    mock_path = mocker.patch("pathlib.Path.open", return_value=MagicMock())
-    mocker.patch("yaml.safe_load", return_value=mock_yaml_config)
-    mocker.patch("logging.config.dictConfig", side_effect=exception)
-    mock_basic_config = mocker.patch("logging.basicConfig")
+    """Failing to write the cache does not fail the load"""
+    mocker.patch("pathlib.Path.replace", side_effect=PermissionError)
 
-    configure_logger()
+    assert load_yaml_config(yaml_file) == mock_yaml_config
+    assert list(cache_dir.iterdir()) == []
 
-    expected_calls = [
-        mocker.call.info("Loading logging configuration from YAML file..."),
-        mocker.call.debug("Read YAML config: %s", mock_yaml_config),
-        mocker.call.debug("Resolved YAML config: %s", mock_yaml_config),
-        mocker.call.exception("Error in logging configuration."),
-        mocker.call.info("Default logging configuration applied."),
-    ]
-    mock_logger.assert_has_calls(expected_calls, any_order=False)
-    mock_path.assert_called_once()
-    mock_basic_config.assert_called_once()
 
+def test_load_yaml_config_missing_cache_dir(
+    yaml_file: Path, cache_dir: Path, mock_yaml_config: dict[str, Any]
+) -> None:
+    """A cache directory that doesn't exist is not created"""
+    cache_dir.rmdir()
 
-def test_get_all_handlers() -> None:
-    logging.basicConfig()
-    handlers = get_all_handlers()
-    assert isinstance(handlers, set)
-    assert isinstance(handlers.pop(), logging.Handler)
+    assert load_yaml_config(yaml_file) == mock_yaml_config
+    assert not cache_dir.exists()
 
 
-def test_start_queue_listeners(mocker: MockerFixture, mock_logger: MagicMock) -> None:
-    mocked_queue_handler = MockQueueHandler(
-        name="queue_handler", listener=mocker.Mock()
-    )
+@pytest.mark.parametrize(
+    ("yaml_text", "expected"),
+    [
+        ("1: one\n", {1: "one"}),  # Int key would come back as "1"
+        ("day: 2025-01-01\n", {"day": dt.date(2025, 1, 1)}),  # Not JSON-able
+    ],
+    ids=["int_key", "date"],
+)
+def test_load_yaml_config_skips_lossy_cache(
+    tmp_path: Path, cache_dir: Path, yaml_text: str, expected: dict[Any, Any]
+) -> None:
+    """Configs that don't round-trip through JSON are never cached"""
+    yaml_path = tmp_path / "logger.yaml"
+    yaml_path.write_text(yaml_text, encoding="utf-8")
+
+    assert load_yaml_config(yaml_path) == expected
+    assert load_yaml_config(yaml_path) == expected
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_get_all_handlers() -> None:
+    # Attach to a dedicated logger rather than mutating the root logger
+    test_logger = logging.getLogger("test_get_all_handlers")
+    null_handler = logging.NullHandler()
+    test_logger.addHandler(null_handler)
+    try:
+        handlers = get_all_handlers()
+    finally:
+        test_logger.removeHandler(null_handler)
+    assert isinstance(handlers, list)
+    assert null_handler in handlers
+    assert len(handlers) == len(set(handlers))
+
+
+def test_start_queue_listeners(
+    mocker: MockerFixture,
+    mock_logger: MagicMock,
+    queue_handler: MockQueueHandler,
+) -> None:
+    mocked_queue_handler = queue_handler
     mock_get_all_handlers = mocker.patch(
-        "lib.logger_setup.get_all_handlers", return_value={mocked_queue_handler}
+        "lib.logger_setup.get_all_handlers", return_value=[mocked_queue_handler]
     )
 
     start_queue_listeners()
@@ -203,7 +384,7 @@ def test_start_queue_listeners_no_queue_handlers(
     mocker: MockerFixture, mock_logger: MagicMock
 ) -> None:
     mock_get_all_handlers = mocker.patch(
-        "lib.logger_setup.get_all_handlers", return_value={}
+        "lib.logger_setup.get_all_handlers", return_value=[]
     )
 
     start_queue_listeners()
@@ -217,15 +398,15 @@ def test_start_queue_listeners_no_queue_handlers(
 
 
 def test_start_queue_listeners_callable_handler(
-    mocker: MockerFixture, mock_logger: MagicMock
+    mocker: MockerFixture,
+    mock_logger: MagicMock,
+    queue_handler: MockQueueHandler,
 ) -> None:
     """Test start_queue_listeners when 'handler_name' is callable (e.g., weakref)"""
-    mocked_queue_handler = MockQueueHandler(
-        name="queue_handler", listener=mocker.Mock()
-    )
+    mocked_queue_handler = queue_handler
     callable_handler = mocker.Mock(return_value=mocked_queue_handler)
     mock_get_all_handlers = mocker.patch(
-        "lib.logger_setup.get_all_handlers", return_value={callable_handler}
+        "lib.logger_setup.get_all_handlers", return_value=[callable_handler]
     )
 
     start_queue_listeners()
@@ -254,7 +435,7 @@ def test_start_queue_listeners_invalid_handler_type(
     invalid_handler = mocker.Mock()
     invalid_handler.__class__ = str  # Make it clearly not a Handler
     mock_get_all_handlers = mocker.patch(
-        "lib.logger_setup.get_all_handlers", return_value={invalid_handler}
+        "lib.logger_setup.get_all_handlers", return_value=[invalid_handler]
     )
 
     start_queue_listeners()
@@ -290,7 +471,7 @@ def test_start_queue_listeners_handler_exceptions(
     """
     faulty_handler = mocker.Mock(side_effect=exception)
     mock_get_all_handlers = mocker.patch(
-        "lib.logger_setup.get_all_handlers", return_value={faulty_handler}
+        "lib.logger_setup.get_all_handlers", return_value=[faulty_handler]
     )
 
     start_queue_listeners()
@@ -304,13 +485,14 @@ def test_start_queue_listeners_handler_exceptions(
 
 
 def test_start_queue_listeners_no_listener(
-    mocker: MockerFixture, mock_logger: MagicMock
+    mocker: MockerFixture,
+    mock_logger: MagicMock,
+    queue_handler_no_listener: MockQueueHandler,
 ) -> None:
     """Test start_queue_listeners when 'queue handler' has no listener"""
-    # Create a queue handler without a listener (listener=None)
-    mocked_queue_handler = MockQueueHandler(name="queue_handler", listener=None)
+    mocked_queue_handler = queue_handler_no_listener
     mock_get_all_handlers = mocker.patch(
-        "lib.logger_setup.get_all_handlers", return_value={mocked_queue_handler}
+        "lib.logger_setup.get_all_handlers", return_value=[mocked_queue_handler]
     )
 
     start_queue_listeners()
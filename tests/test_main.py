@@ -1,6 +1,7 @@
 """Unit tests for main.py"""
 
-from unittest.mock import AsyncMock, MagicMock, Mock, NonCallableMagicMock
+from collections.abc import Generator
+from unittest.mock import DEFAULT, MagicMock, Mock, call, patch
 
 import pytest
 from pytest_mock import MockerFixture
@@ -9,22 +10,19 @@ from main import main
 
 
 @pytest.fixture(autouse=True)
-def mock_common_calls(
-    mocker: MockerFixture,
-) -> tuple[
-    MagicMock | AsyncMock | NonCallableMagicMock,
-    MagicMock | AsyncMock | NonCallableMagicMock,
+def mock_common_calls() -> Generator[  # noqa: UP043 unnecessary default type args
+    tuple[MagicMock, MagicMock], None, None
 ]:
     """Fixture to mock common calls"""
-    mock_config = mocker.patch("main.Config")
-    mock_configure_logger = mocker.patch("main.configure_logger")
-    return mock_config, mock_configure_logger
+    with patch.multiple("main", Config=DEFAULT, configure_logger=DEFAULT) as mocks:
+        yield mocks["Config"], mocks["configure_logger"]
 
 
-@pytest.fixture
-def mock_logger(mocker: MockerFixture) -> Mock:
+@pytest.fixture(autouse=True)
+def mock_logger() -> Generator[MagicMock, None, None]:  # noqa: UP043 unnecessary default type args
     """Fixture to mock the logger"""
-    return mocker.patch("main.logger")
+    with patch("main.logger") as mock:
+        yield mock
 
 
 @pytest.fixture
@@ -33,19 +31,43 @@ def mock_uvicorn(mocker: MockerFixture) -> Mock:
     return mocker.patch("main.uvicorn.run")
 
 
+@pytest.mark.parametrize(
+    ("dry_run", "expected_logs"),
+    [
+        (
+            True,
+            [
+                call("Running in dry-run mode."),
+                call("Configuring logger..."),
+                call("Starting FastAPI server..."),
+            ],
+        ),
+        (
+            False,
+            [
+                call("Configuring logger..."),
+                call("Starting FastAPI server..."),
+            ],
+        ),
+    ],
+    ids=["dry_run_enabled", "dry_run_disabled"],
+)
 def test_main_successful_run(
     mocker: MockerFixture,
     mock_common_calls: tuple[Mock, Mock],
     mock_logger: Mock,
     mock_uvicorn: Mock,
+    dry_run: bool,
+    expected_logs: list[object],
 ) -> None:
-    """Test successful execution of main()"""
+    """Test successful execution of main() with and without DRY_RUN"""
     # Unpack the mocks directly from the fixture in the function signature
     mock_config_class, mock_configure_logger = mock_common_calls
 
-    # Configure the mock config instance to return API_PORT
+    # Configure the mock config instance to return API_PORT and DRY_RUN
     mock_config_instance = Mock()
     mock_config_instance.API_PORT = 8000
+    mock_config_instance.DRY_RUN = dry_run
     mock_config_class.return_value = mock_config_instance
 
     # Mock validate_port to return a specific value
@@ -54,12 +76,8 @@ def test_main_successful_run(
     # Call the main function
     main()
 
-    # Verify expected log messages (removed load_dotenv log message)
-    expected_logs = [
-        mocker.call.info("Configuring logger..."),
-        mocker.call.info("Starting FastAPI server..."),
-    ]
-    mock_logger.assert_has_calls(expected_logs, any_order=False)
+    # Verify expected log messages
+    assert mock_logger.info.mock_calls == expected_logs
 
     # Verify that uvicorn.run was called with the correct parameters
     mock_uvicorn.assert_called_once_with(
@@ -100,102 +118,18 @@ def test_default_port(mocker: MockerFixture, mock_uvicorn: Mock) -> None:
     )
 
 
-def test_invalid_port(mocker: MockerFixture) -> None:
+def test_invalid_port() -> None:
     """Test behavior with invalid port values"""
     # Mock Config to return an invalid API_PORT value
-    mock_config_class = mocker.patch("main.Config")
     mock_config_instance = Mock()
     mock_config_instance.API_PORT = "invalid"  # String that can't be converted to int
-    mock_config_class.return_value = mock_config_instance
 
     # Call the main function and expect ValueError to be raised
     # since main.py tries to convert config.API_PORT to int
-    with pytest.raises(
-        ValueError, match=r"invalid literal for int\(\) with base 10: \'invalid\'"
+    with (
+        patch("main.Config", return_value=mock_config_instance),
+        pytest.raises(
+            ValueError, match=r"invalid literal for int\(\) with base 10: \'invalid\'"
+        ),
     ):
         main()
-
-
-def test_main_dry_run_mode(
-    mocker: MockerFixture,
-    mock_common_calls: tuple[Mock, Mock],
-    mock_logger: Mock,
-    mock_uvicorn: Mock,
-) -> None:
-    """Test main() execution when DRY_RUN is enabled"""
-    # Unpack the mocks from the fixture
-    mock_config_class, mock_configure_logger = mock_common_calls
-
-    # Configure the mock config instance with DRY_RUN enabled
-    mock_config_instance = Mock()
-    mock_config_instance.API_PORT = 8000
-    mock_config_instance.DRY_RUN = True
-    mock_config_class.return_value = mock_config_instance
-
-    # Mock validate_port to return a specific value
-    mocker.patch("main.validate_port", return_value=8000)
-
-    # Call the main function
-    main()
-
-    # Verify expected log messages including the dry-run message
-    expected_logs = [
-        mocker.call.info("Running in dry-run mode."),
-        mocker.call.info("Configuring logger..."),
-        mocker.call.info("Starting FastAPI server..."),
-    ]
-    mock_logger.assert_has_calls(expected_logs, any_order=False)
-
-    # Verify that uvicorn.run was called with the correct parameters
-    mock_uvicorn.assert_called_once_with(
-        mocker.ANY,  # app
-        host="0.0.0.0",  # noqa: S104
-        port=8000,
-        log_config=None,
-    )
-
-    # Verify Config was instantiated
-    mock_config_class.assert_called_once()
-    mock_configure_logger.assert_called_once()
-
-
-def test_main_dry_run_disabled(
-    mocker: MockerFixture,
-    mock_common_calls: tuple[Mock, Mock],
-    mock_logger: Mock,
-    mock_uvicorn: Mock,
-) -> None:
-    """Test main() execution when DRY_RUN is disabled"""
-    # Unpack the mocks from the fixture
-    mock_config_class, mock_configure_logger = mock_common_calls
-
-    # Configure the mock config instance with DRY_RUN disabled
-    mock_config_instance = Mock()
-    mock_config_instance.API_PORT = 8000
-    mock_config_instance.DRY_RUN = False
-    mock_config_class.return_value = mock_config_instance
-
-    # Mock validate_port to return a specific value
-    mocker.patch("main.validate_port", return_value=8000)
-
-    # Call the main function
-    main()
-
-    # Verify expected log messages (should NOT include dry-run message)
-    expected_logs = [
-        mocker.call.info("Configuring logger..."),
-        mocker.call.info("Starting FastAPI server..."),
-    ]
-    mock_logger.assert_has_calls(expected_logs, any_order=False)
-
-    # Verify that uvicorn.run was called with the correct parameters
-    mock_uvicorn.assert_called_once_with(
-        mocker.ANY,  # app
-        host="0.0.0.0",  # noqa: S104
-        port=8000,
-        log_config=None,
-    )
-
-    # Verify Config was instantiated
-    mock_config_class.assert_called_once()
-    mock_configure_logger.assert_called_once()
@@ -2,375 +2,477 @@
 
 import socket
 import urllib.error
-from collections.abc import Generator
+from collections.abc import Callable
 from email.message import EmailMessage
-from unittest.mock import MagicMock, patch
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from typing import NoReturn
 
 import pytest
 from feedparser import FeedParserDict
-
-from lib.youtube import YoutubeFeedParser
-
-
-@pytest.fixture
+from pytest_mock import MockerFixture
+
+from lib.youtube import SEEN_VIDEOS_MAXLEN, YoutubeFeedParser, _BoundedSet
+from tests.utils import make_entry
+
+_EMPTY_HEADERS = EmailMessage()
+# Every network failure the parser catches, shared by the error-handling tests.
+# Each test builds a fresh instance so no traceback carries over between tests
+_NETWORK_ERRORS = [
+    pytest.param(partial(urllib.error.URLError, "Network error"), id="url_error"),
+    pytest.param(
+        partial(urllib.error.HTTPError, "url", 404, "Not Found", _EMPTY_HEADERS, None),
+        id="http_error",
+    ),
+    pytest.param(partial(TimeoutError, "Timeout"), id="timeout"),
+    pytest.param(partial(socket.gaierror, "DNS error"), id="gaierror"),
+    pytest.param(
+        partial(ConnectionResetError, "Connection reset"), id="connection_reset"
+    ),
+]
+_BOZO_EXC = Exception("Feed parse error")
+_EXPECTED_VIDEO = {
+    "id": "yt:video:abcdef123",
+    "title": "Test Video Title",
+    "link": "https://www.youtube.com/watch?v=abcdef123",
+    "published": "2025-01-01T00:00:00+00:00",
+    "summary": "Test video summary",
+    "author": "Test Author",
+}
+
+
+@pytest.fixture(scope="session")
 def mock_feed_url() -> str:
     """Mock YouTube RSS feed URL"""
     return "https://www.youtube.com/feeds/videos.xml?channel_id=TEST_CHANNEL_ID"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_feed_name() -> str:
     """Mock feed name"""
     return "Test Channel"
 
 
+@pytest.fixture(scope="module")
+def feed_bytes() -> bytes:
+    """Raw YouTube RSS feed with two videos, read once per module"""
+    return (Path(__file__).parent / "data" / "youtube_feed.xml").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def make_feed_entry() -> Callable[..., FeedParserDict]:
+    """
+    Factory for mock feedparser entries, leaving out any keys in `omit`;
+    every call returns a fresh entry that tests may mutate
+    """
+
+    def _make_feed_entry(omit: tuple[str, ...] = ()) -> FeedParserDict:
+        entry = make_entry(
+            "abcdef123",
+            title="Test Video Title",
+            summary="Test video summary",
+            author="Test Author",
+        )
+        for key in omit:
+            del entry[key]
+        return entry
+
+    return _make_feed_entry
+
+
 @pytest.fixture
-def mock_feed_entry() -> FeedParserDict:
+def mock_feed_entry(make_feed_entry: Callable[..., FeedParserDict]) -> FeedParserDict:
     """Mock feedparser entry"""
-    entry = FeedParserDict()
-    entry.id = "yt:video:abcdef123"
-    entry.yt_videoid = ("abcdef123",)
-    entry.link = "https://www.youtube.com/watch?v=TEST_VIDEO_ID"
-    entry.title = "Test Video Title"
-    entry.published = "2025-01-01T00:00:00+00:00"
-    entry.published_parsed = (2025, 1, 1, 0, 0, 0, 0, 1, 0)
-    entry.summary = "Test video summary"
-    entry.author = "Test Author"
-    return entry
+    return make_feed_entry()
 
 
 @pytest.fixture
-def mock_feed_with_entries(mock_feed_entry: FeedParserDict) -> MagicMock:
-    """Mock feedparser feed with entries"""
-    feed = MagicMock()
-    feed.bozo = False
-    feed.entries = [mock_feed_entry]
-    return feed
+def make_feed(mock_feed_entry: FeedParserDict) -> Callable[..., SimpleNamespace]:
+    """Factory for mock feedparser feeds, holding `mock_feed_entry` by default"""
+
+    def _make_feed(
+        entries: list[FeedParserDict] | None = None,
+        *,
+        bozo: bool = False,
+        bozo_exception: Exception | None = None,
+    ) -> SimpleNamespace:
+        return SimpleNamespace(
+            bozo=bozo,
+            bozo_exception=bozo_exception,
+            entries=entries if entries is not None else [mock_feed_entry],
+            feed=SimpleNamespace(title="Test Channel"),
+        )
+
+    return _make_feed
 
 
 @pytest.fixture
-def mock_empty_feed() -> MagicMock:
-    """Mock empty feedparser feed"""
-    feed = MagicMock()
-    feed.bozo = False
-    feed.entries = []
-    return feed
+def fp(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """
+    Stand-in for feedparser.parse; tests set `ret` to the parsed feed,
+    `exc` to the exception it should raise, or queue up per-call `results`
+    """
+    holder = SimpleNamespace(ret=None, exc=None, results=[])
+
+    def fake_parse(*_args: object, **_kwargs: object) -> object:
+        if holder.results:
+            result = holder.results.pop(0)
+            if isinstance(result, BaseException):
+                raise result
+            return result
+        if holder.exc is not None:
+            raise holder.exc
+        return holder.ret
+
+    monkeypatch.setattr("feedparser.parse", fake_parse)
+    return holder
 
 
 @pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Record the retry backoff delays instead of sleeping"""
+    recorded: list[float] = []
+    monkeypatch.setattr("lib.youtube.time.sleep", recorded.append)
+    return recorded
+
+
+@pytest.fixture(scope="module")
+def parser_factory(
+    mock_feed_name: str, mock_feed_url: str
+) -> Callable[[Exception], YoutubeFeedParser]:
+    """Factory for parsers whose initial feed fetch raises `exception`"""
+
+    def _make_parser(exception: Exception) -> YoutubeFeedParser:
+        def _raise(*_args: object, **_kwargs: object) -> NoReturn:
+            raise exception
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("feedparser.parse", _raise)
+            mp.setattr("lib.youtube.time.sleep", lambda _delay: None)
+            return YoutubeFeedParser(mock_feed_name, mock_feed_url)
+
+    return _make_parser
+
+
+@pytest.fixture(scope="module")
 def youtube_parser_no_init(
     mock_feed_name: str, mock_feed_url: str
-) -> Generator[YoutubeFeedParser, None, None]:  # noqa: UP043 unnecessary default type args
-    """YoutubeFeedParser fixture with initialization mocked"""
-    with patch.object(YoutubeFeedParser, "_initialize_seen_videos", return_value=set()):
-        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-        yield parser
+) -> YoutubeFeedParser:
+    """YoutubeFeedParser fixture that skips the initial feed fetch"""
+    # Bypass __init__ rather than patching _initialize_seen_videos on the class
+    parser = YoutubeFeedParser.__new__(YoutubeFeedParser)
+    parser.feed_name = mock_feed_name
+    parser.feed_url = mock_feed_url
+    parser.seen_videos = _BoundedSet()
+    return parser
 
 
 class TestYoutubeFeedParserInit:
     """Tests for YoutubeFeedParser initialization"""
 
-    def test_init_stores_feed_name_and_url(
-        self,
-        mock_feed_name: str,
-        mock_feed_url: str,
-        youtube_parser_no_init: YoutubeFeedParser,
+    def test_init(
+        self, mocker: MockerFixture, mock_feed_name: str, mock_feed_url: str
     ) -> None:
-        """Test that __init__ stores feed_name and feed_url"""
-        assert youtube_parser_no_init.feed_name == mock_feed_name
-        assert youtube_parser_no_init.feed_url == mock_feed_url
+        """Test that __init__ stores its arguments and loads seen_videos"""
+        mock_init = mocker.patch.object(
+            YoutubeFeedParser,
+            "_initialize_seen_videos",
+            return_value={"video1", "video2"},
+        )
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        mock_init.assert_called_once()
+        assert parser.feed_name == mock_feed_name
+        assert parser.feed_url == mock_feed_url
+        assert parser.seen_videos == {"video1", "video2"}
 
-    def test_init_initializes_seen_videos(
+    def test_bulk_create(
         self,
-        youtube_parser_no_init: YoutubeFeedParser,
+        fp: SimpleNamespace,
+        mock_feed_url: str,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
-        """Test that __init__ initializes seen_videos set"""
-        assert isinstance(youtube_parser_no_init.seen_videos, set)
+        """Test that bulk_create initializes one parser per feed, keyed by name"""
+        fp.ret = make_feed()
+        feeds = {"Channel A": mock_feed_url, "Channel B": mock_feed_url}
 
-    def test_init_calls_initialize_seen_videos(
-        self, mock_feed_name: str, mock_feed_url: str
-    ) -> None:
-        """Test that __init__ calls _initialize_seen_videos"""
-        with patch.object(
-            YoutubeFeedParser,
-            "_initialize_seen_videos",
-            return_value={"video1", "video2"},
-        ) as mock_init:
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            mock_init.assert_called_once()
-            assert parser.seen_videos == {"video1", "video2"}
+        parsers = YoutubeFeedParser.bulk_create(feeds, max_workers=2)
+
+        assert list(parsers) == list(feeds)
+        for feed_name, parser in parsers.items():
+            assert parser.feed_name == feed_name
+            assert parser.seen_videos == {_EXPECTED_VIDEO["id"]}
+
+
+class TestBoundedSet:
+    """Tests for the _BoundedSet backing seen_videos"""
+
+    def test_evicts_oldest(self) -> None:
+        """Test that adding past maxlen drops the oldest item"""
+        bounded = _BoundedSet(["a", "b", "c"], maxlen=2)
+        assert list(bounded) == ["b", "c"]
+        assert "a" not in bounded
+        assert len(bounded) == 2
+
+    def test_readd_refreshes_item(self) -> None:
+        """Test that re-adding an item moves it to the newest position"""
+        bounded = _BoundedSet(["a", "b"], maxlen=2)
+        bounded.add("a")
+        bounded.add("c")
+        assert list(bounded) == ["a", "c"]
+
+    def test_discard_and_clear(self) -> None:
+        """Test that discard ignores missing items and clear empties the set"""
+        bounded = _BoundedSet(["a", "b"])
+        bounded.discard("a")
+        bounded.discard("missing")
+        assert bounded == {"b"}
+        bounded.clear()
+        assert len(bounded) == 0
+
+    def test_repr(self) -> None:
+        """Test the debug representation lists items oldest first"""
+        assert repr(_BoundedSet(["a"], maxlen=5)) == "_BoundedSet(['a'], maxlen=5)"
 
 
 class TestGetThumbnailFromEntry:
     """Tests for the get_thumbnail_from_entry method"""
 
+    @pytest.mark.parametrize(
+        ("yt_videoid", "expected"),
+        [
+            (
+                "abcdef123",
+                "https://img.youtube.com/vi/abcdef123/maxresdefault.jpg",
+            ),
+            ("", None),
+            (None, None),
+        ],
+        ids=["video_id", "empty_video_id", "missing_video_id"],
+    )
     def test_get_thumbnail_from_entry(
         self,
+        mocker: MockerFixture,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_entry: FeedParserDict,
+        make_feed_entry: Callable[..., FeedParserDict],
+        yt_videoid: str | None,
+        expected: str | None,
     ) -> None:
-        """Test getting thumbnail from entry"""
+        """Test thumbnail generation with and without a usable video ID"""
+        mock_feed_entry = make_feed_entry(omit=("yt_videoid",))
+        if yt_videoid is not None:
+            mock_feed_entry["yt_videoid"] = yt_videoid
+        mock_logger = mocker.patch("lib.youtube.logger")
+
         result = youtube_parser_no_init.get_thumbnail_from_entry(mock_feed_entry)
-        assert (
-            result
-            == f"https://img.youtube.com/vi/{mock_feed_entry.yt_videoid}/maxresdefault.jpg"
-        )
 
-    def test_get_thumbnail_from_entry_missing_video_id(
-        self,
-        youtube_parser_no_init: YoutubeFeedParser,
-    ) -> None:
-        """Test failed thumbnail generation"""
-        # Create a fresh entry without yt_videoid to avoid fixture pollution
-        entry = FeedParserDict()
-        entry.id = "yt:video:abcdef123"
-        entry.link = "https://www.youtube.com/watch?v=TEST_VIDEO_ID"
-        entry.title = "Test Video Title"
-        entry.published = "2025-01-01T00:00:00+00:00"
-        entry.published_parsed = (2025, 1, 1, 0, 0, 0, 0, 1, 0)
-        entry.summary = "Test video summary"
-        entry.author = "Test Author"
-        # Deliberately not setting yt_videoid
-
-        # Mock the logger to capture the warning call directly
-        with patch("lib.youtube.logger") as mock_logger:
-            result = youtube_parser_no_init.get_thumbnail_from_entry(entry)
-
-            # Verify the method was called and the warning was logged
-            assert result is None
+        assert result == expected
+        if expected is None:
             mock_logger.warning.assert_called_once()
-
-            # Get the call arguments to verify the message
-            call_args = mock_logger.warning.call_args
-            assert "Could not extract video ID from entry" in call_args[0][0]
+            assert (
+                "Could not extract video ID from entry"
+                in mock_logger.warning.call_args[0][0]
+            )
+        else:
+            mock_logger.warning.assert_not_called()
 
 
 class TestInitializeSeenVideos:
     """Tests for _initialize_seen_videos method"""
 
-    def test_initialize_seen_videos_real_config(self) -> None:
+    @pytest.mark.network
+    def test_initialize_seen_videos_real_config(
+        self, real_youtube_parsers: dict[str, YoutubeFeedParser]
+    ) -> None:
         """Test initialization with a real config file"""
-        from lib.config import config  # noqa: PLC0415 imports at the top of the file
-
-        for feed_name, feed_url in config.YOUTUBE_FEEDS.items():
-            parser = YoutubeFeedParser(feed_name, feed_url)
+        assert real_youtube_parsers
+        for parser in real_youtube_parsers.values():
             assert len(parser.seen_videos) > 0
 
     def test_initialize_seen_videos_success(
         self,
+        fp: SimpleNamespace,
         mock_feed_name: str,
         mock_feed_url: str,
-        mock_feed_with_entries: MagicMock,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test successful initialization of seen videos"""
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert mock_feed_with_entries.entries[0].id in parser.seen_videos
-            assert len(parser.seen_videos) == 1
+        feed = make_feed()
+        fp.ret = feed
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        assert feed.entries[0].id in parser.seen_videos
+        assert len(parser.seen_videos) == 1
+
+    def test_initialize_seen_videos_initial_data(
+        self, mock_feed_name: str, mock_feed_url: str, feed_bytes: bytes
+    ) -> None:
+        """Test that initial_data is parsed with the real feedparser, offline"""
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url, feed_bytes)
+        assert parser.seen_videos == {"yt:video:VIDEO_1", "yt:video:VIDEO_2"}
+        # Seen videos are bounded: newer videos push the initial ones out
+        parser.seen_videos |= {f"yt:video:NEW_{i}" for i in range(SEEN_VIDEOS_MAXLEN)}
+        assert len(parser.seen_videos) == SEEN_VIDEOS_MAXLEN
+        assert parser.seen_videos.isdisjoint({"yt:video:VIDEO_1", "yt:video:VIDEO_2"})
+
+    def test_initialize_seen_videos_initial_data_no_retry(
+        self, sleeps: list[float], mock_feed_name: str, mock_feed_url: str
+    ) -> None:
+        """Test that malformed initial_data is parsed once, without retrying"""
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url, b"not a feed")
+        assert sleeps == []
+        assert len(parser.seen_videos) == 0
 
     def test_initialize_seen_videos_empty_feed(
-        self, mock_feed_name: str, mock_feed_url: str, mock_empty_feed: MagicMock
+        self,
+        fp: SimpleNamespace,
+        mock_feed_name: str,
+        mock_feed_url: str,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test initialization with an empty feed"""
-        with patch("feedparser.parse", return_value=mock_empty_feed):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert len(parser.seen_videos) == 0
+        fp.ret = make_feed(entries=[])
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        assert len(parser.seen_videos) == 0
 
     def test_initialize_seen_videos_bozo_feed(
-        self, mock_feed_name: str, mock_feed_url: str, mock_empty_feed: MagicMock
+        self,
+        fp: SimpleNamespace,
+        sleeps: list[float],
+        mock_feed_name: str,
+        mock_feed_url: str,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test initialization with a malformed feed (bozo=True)"""
-        mock_empty_feed.bozo = True
-        mock_empty_feed.bozo_exception = Exception("Feed parse error")
-        with patch("feedparser.parse", return_value=mock_empty_feed):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert len(parser.seen_videos) == 0
-
-    def test_initialize_seen_videos_url_error(
-        self, mock_feed_name: str, mock_feed_url: str
-    ) -> None:
-        """Test initialization handles URLError"""
-        with patch(
-            "feedparser.parse", side_effect=urllib.error.URLError("Network error")
-        ):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert len(parser.seen_videos) == 0
-
-    def test_initialize_seen_videos_http_error(
-        self, mock_feed_name: str, mock_feed_url: str
-    ) -> None:
-        """Test initialization handles HTTPError"""
-        with patch(
-            "feedparser.parse",
-            side_effect=urllib.error.HTTPError(
-                "url", 404, "Not Found", EmailMessage(), None
-            ),
-        ):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert len(parser.seen_videos) == 0
-
-    def test_initialize_seen_videos_timeout_error(
-        self, mock_feed_name: str, mock_feed_url: str
-    ) -> None:
-        """Test initialization handles TimeoutError"""
-        with patch("feedparser.parse", side_effect=TimeoutError("Timeout")):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert len(parser.seen_videos) == 0
+        fp.ret = make_feed(entries=[], bozo=True, bozo_exception=_BOZO_EXC)
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        assert len(parser.seen_videos) == 0
+        assert len(sleeps) == 2
 
-    def test_initialize_seen_videos_socket_gaierror(
-        self, mock_feed_name: str, mock_feed_url: str
+    @pytest.mark.parametrize("make_exception", _NETWORK_ERRORS)
+    def test_initialize_seen_videos_network_errors(
+        self,
+        parser_factory: Callable[[Exception], YoutubeFeedParser],
+        make_exception: Callable[[], Exception],
     ) -> None:
-        """Test initialization handles socket.gaierror"""
-        with patch("feedparser.parse", side_effect=socket.gaierror("DNS error")):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert len(parser.seen_videos) == 0
+        """Test initialization handles network errors"""
+        parser = parser_factory(make_exception())
+        assert len(parser.seen_videos) == 0
 
-    def test_initialize_seen_videos_connection_reset(
-        self, mock_feed_name: str, mock_feed_url: str
-    ) -> None:
-        """Test initialization handles ConnectionResetError"""
-        with patch(
-            "feedparser.parse", side_effect=ConnectionResetError("Connection reset")
-        ):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            assert len(parser.seen_videos) == 0
-
-    def test_handle_feed_fetch_error_should_retry(self) -> None:
+    def test_handle_feed_fetch_error_should_retry(self, sleeps: list[float]) -> None:
         """Test error handler returns True when retries remain"""
-        with patch("lib.youtube.time.sleep") as mock_sleep:
-            should_retry = YoutubeFeedParser._handle_feed_fetch_error(
-                "Network error", attempt=0, max_retries=3, retry_delay=1
-            )
+        should_retry = YoutubeFeedParser._handle_feed_fetch_error(
+            "Network error", attempt=0, max_retries=3, retry_delay=1
+        )
 
-            assert should_retry is True
-            mock_sleep.assert_called_once_with(1)
+        assert should_retry is True
+        assert sleeps == [1]
 
-    def test_handle_feed_fetch_error_retries_exhausted(self) -> None:
+    def test_handle_feed_fetch_error_retries_exhausted(
+        self, sleeps: list[float]
+    ) -> None:
         """Test error handler returns False when retries exhausted"""
-        with patch("lib.youtube.time.sleep") as mock_sleep:
-            should_retry = YoutubeFeedParser._handle_feed_fetch_error(
-                "Network error", attempt=2, max_retries=3, retry_delay=4
-            )
+        should_retry = YoutubeFeedParser._handle_feed_fetch_error(
+            "Network error", attempt=2, max_retries=3, retry_delay=4
+        )
 
-            assert should_retry is False
-            mock_sleep.assert_not_called()
+        assert should_retry is False
+        assert sleeps == []
 
     def test_initialize_exponential_backoff(
-        self, mock_feed_name: str, mock_feed_url: str
+        self,
+        fp: SimpleNamespace,
+        sleeps: list[float],
+        mock_feed_name: str,
+        mock_feed_url: str,
     ) -> None:
         """Test exponential backoff: 1s → 2s delays (max 3 attempts, 2 retries)"""
-        with (
-            patch(
-                "feedparser.parse",
-                side_effect=urllib.error.URLError("Network error"),
-            ),
-            patch("lib.youtube.time.sleep") as mock_sleep,
-        ):
-            _ = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        fp.exc = urllib.error.URLError("Network error")
+        _ = YoutubeFeedParser(mock_feed_name, mock_feed_url)
 
-            # Only 2 sleeps: attempt 0 and 1 retry, attempt 2 is final (no sleep)
-            assert mock_sleep.call_count == 2
-            calls = [call.args[0] for call in mock_sleep.call_args_list]
-            assert calls == [1, 2]
+        # Only 2 sleeps: attempt 0 and 1 retry, attempt 2 is final (no sleep)
+        assert sleeps == [1, 2]
 
     def test_initialize_succeeds_on_second_attempt(
-        self, mock_feed_name: str, mock_feed_url: str, mock_feed_with_entries: MagicMock
+        self,
+        fp: SimpleNamespace,
+        sleeps: list[float],
+        mock_feed_name: str,
+        mock_feed_url: str,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test successful initialization after one retry"""
-        with (
-            patch(
-                "feedparser.parse",
-                side_effect=[
-                    urllib.error.URLError("Transient error"),
-                    mock_feed_with_entries,
-                ],
-            ),
-            patch("lib.youtube.time.sleep") as mock_sleep,
-        ):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        feed = make_feed()
+        fp.results = [urllib.error.URLError("Transient error"), feed]
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
 
-            mock_sleep.assert_called_once_with(1)
-            assert len(parser.seen_videos) == 1
-            assert mock_feed_with_entries.entries[0].id in parser.seen_videos
+        assert sleeps == [1]
+        assert len(parser.seen_videos) == 1
+        assert feed.entries[0].id in parser.seen_videos
 
-    @pytest.mark.parametrize(
-        "exception",
-        [
-            urllib.error.URLError("Network"),
-            urllib.error.HTTPError("url", 500, "Error", EmailMessage(), None),
-            TimeoutError("Timeout"),
-            socket.gaierror("DNS"),
-            ConnectionResetError("Reset"),
-        ],
-    )
+    @pytest.mark.parametrize("make_exception", _NETWORK_ERRORS)
     def test_initialize_retry_all_exception_types(
-        self, mock_feed_name: str, mock_feed_url: str, exception: Exception
+        self,
+        fp: SimpleNamespace,
+        sleeps: list[float],
+        mock_feed_name: str,
+        mock_feed_url: str,
+        make_exception: Callable[[], Exception],
     ) -> None:
         """Test retry logic for all exception types (max 3 attempts, 2 retries)"""
-        with (
-            patch("feedparser.parse", side_effect=exception),
-            patch("lib.youtube.time.sleep") as mock_sleep,
-        ):
-            _ = YoutubeFeedParser(mock_feed_name, mock_feed_url)
-            # Only 2 sleeps: attempt 0 and 1 retry, attempt 2 is final (no sleep)
-            assert mock_sleep.call_count == 2
+        fp.exc = make_exception()
+        _ = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        # Only 2 sleeps: attempt 0 and 1 retry, attempt 2 is final (no sleep)
+        assert len(sleeps) == 2
 
     def test_initialize_bozo_feed_retries(
-        self, mock_feed_name: str, mock_feed_url: str
+        self,
+        fp: SimpleNamespace,
+        sleeps: list[float],
+        mock_feed_name: str,
+        mock_feed_url: str,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test bozo feed with no entries triggers retry (max 3 attempts, 2 retries)"""
-        bozo_feed = MagicMock()
-        bozo_feed.bozo = True
-        bozo_feed.entries = []
-        bozo_feed.bozo_exception = Exception("Parse error")
-
-        with (
-            patch("feedparser.parse", return_value=bozo_feed),
-            patch("lib.youtube.time.sleep") as mock_sleep,
-        ):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        fp.ret = make_feed(entries=[], bozo=True, bozo_exception=_BOZO_EXC)
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
 
-            # Only 2 sleeps: attempt 0 and 1 retry, attempt 2 is final (no sleep)
-            assert mock_sleep.call_count == 2
-            assert len(parser.seen_videos) == 0
+        # Only 2 sleeps: attempt 0 and 1 retry, attempt 2 is final (no sleep)
+        assert len(sleeps) == 2
+        assert len(parser.seen_videos) == 0
 
     def test_initialize_bozo_feed_with_entries_no_retry(
-        self, mock_feed_name: str, mock_feed_url: str, mock_feed_with_entries: MagicMock
+        self,
+        fp: SimpleNamespace,
+        sleeps: list[float],
+        mock_feed_name: str,
+        mock_feed_url: str,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test bozo feed WITH entries does NOT retry"""
-        mock_feed_with_entries.bozo = True
-        mock_feed_with_entries.bozo_exception = Exception("Minor issue")
-
-        with (
-            patch("feedparser.parse", return_value=mock_feed_with_entries),
-            patch("lib.youtube.time.sleep") as mock_sleep,
-        ):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        fp.ret = make_feed(bozo=True, bozo_exception=_BOZO_EXC)
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
 
-            mock_sleep.assert_not_called()
-            assert len(parser.seen_videos) == 1
+        assert sleeps == []
+        assert len(parser.seen_videos) == 1
 
     def test_initialize_succeeds_on_third_attempt(
-        self, mock_feed_name: str, mock_feed_url: str, mock_feed_with_entries: MagicMock
+        self,
+        fp: SimpleNamespace,
+        sleeps: list[float],
+        mock_feed_name: str,
+        mock_feed_url: str,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test successful initialization after two retries"""
-        with (
-            patch(
-                "feedparser.parse",
-                side_effect=[
-                    TimeoutError("First timeout"),
-                    socket.gaierror("DNS error"),
-                    mock_feed_with_entries,
-                ],
-            ),
-            patch("lib.youtube.time.sleep") as mock_sleep,
-        ):
-            parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
+        fp.results = [
+            TimeoutError("First timeout"),
+            socket.gaierror("DNS error"),
+            make_feed(),
+        ]
+        parser = YoutubeFeedParser(mock_feed_name, mock_feed_url)
 
-            assert mock_sleep.call_count == 2
-            calls = [call.args[0] for call in mock_sleep.call_args_list]
-            assert calls == [1, 2]
-            assert len(parser.seen_videos) == 1
+        assert sleeps == [1, 2]
+        assert len(parser.seen_videos) == 1
 
 
 class TestGetLatestVideo:
@@ -378,215 +480,183 @@ class TestGetLatestVideo:
 
     def test_get_latest_video(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test getting the latest video from feed"""
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_latest_video()
-            assert result == mock_feed_with_entries.entries[0]
+        feed = make_feed()
+        fp.ret = feed
+        result = youtube_parser_no_init.get_latest_video()
+        assert result == feed.entries[0]
 
 
 class TestGetNewVideos:
     """Tests for get_new_videos method"""
 
+    @pytest.fixture(autouse=True)
+    def reset_seen_videos(self, youtube_parser_no_init: YoutubeFeedParser) -> None:
+        """Forget videos recorded by the previous test on the shared parser"""
+        youtube_parser_no_init.seen_videos.clear()
+
     def test_get_new_videos_new_video(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test parsing feed with new video"""
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 1
-            video_result = result[0]
-            assert video_result is not None
-            assert video_result.id == mock_feed_with_entries.entries[0].id
-            assert video_result.title == mock_feed_with_entries.entries[0].title
-            assert video_result.link == mock_feed_with_entries.entries[0].link
-            assert video_result.published == mock_feed_with_entries.entries[0].published
-            assert video_result.summary == mock_feed_with_entries.entries[0].summary
-            assert video_result.author == mock_feed_with_entries.entries[0].author
-            assert (
-                mock_feed_with_entries.entries[0].id
-                in youtube_parser_no_init.seen_videos
-            )
+        fp.ret = make_feed()
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 1
+        video_result = result[0]
+        assert video_result is not None
+        assert {key: video_result[key] for key in _EXPECTED_VIDEO} == _EXPECTED_VIDEO
+        assert _EXPECTED_VIDEO["id"] in youtube_parser_no_init.seen_videos
 
     def test_get_new_videos_already_seen_video(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test parsing feed with already seen video"""
         youtube_parser_no_init.seen_videos.add("yt:video:abcdef123")
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
+        fp.ret = make_feed()
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 0
 
     def test_get_new_videos_empty(
-        self, youtube_parser_no_init: YoutubeFeedParser, mock_empty_feed: MagicMock
+        self,
+        fp: SimpleNamespace,
+        youtube_parser_no_init: YoutubeFeedParser,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test parsing empty feed"""
-        with patch("feedparser.parse", return_value=mock_empty_feed):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
+        fp.ret = make_feed(entries=[])
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 0
 
     def test_get_new_videos_bozo(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test parsing feed with the bozo flag set"""
-        mock_feed_with_entries.bozo = True
-        mock_feed_with_entries.bozo_exception = Exception("Parse error")
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 1  # Still processes entries despite bozo
+        fp.ret = make_feed(bozo=True, bozo_exception=_BOZO_EXC)
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 1  # Still processes entries despite bozo
 
     def test_get_new_videos_entry_without_summary(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
-        mock_feed_entry: FeedParserDict,
+        make_feed: Callable[..., SimpleNamespace],
+        make_feed_entry: Callable[..., FeedParserDict],
     ) -> None:
         """Test parsing entry without `summary` attribute"""
-        delattr(mock_feed_entry, "summary")
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 1
-            video_result = result[0]
-            assert video_result is not None
-            assert getattr(video_result, "summary", "") == ""
+        fp.ret = make_feed(entries=[make_feed_entry(omit=("summary",))])
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 1
+        video_result = result[0]
+        assert video_result is not None
+        assert getattr(video_result, "summary", "") == ""
 
     def test_get_new_videos_entry_without_author(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
-        mock_feed_entry: FeedParserDict,
+        make_feed: Callable[..., SimpleNamespace],
+        make_feed_entry: Callable[..., FeedParserDict],
     ) -> None:
         """Test parsing entry without `author` attribute"""
-        delattr(mock_feed_entry, "author")
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 1
-            video_result = result[0]
-            assert video_result is not None
-            assert getattr(video_result, "author", "") == ""
-
-    def test_get_new_videos_url_error(
-        self, youtube_parser_no_init: YoutubeFeedParser
-    ) -> None:
-        """Test get_new_videos handles URLError"""
-        with patch(
-            "feedparser.parse", side_effect=urllib.error.URLError("Network error")
-        ):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
-
-    def test_get_new_videos_http_error(
-        self, youtube_parser_no_init: YoutubeFeedParser
-    ) -> None:
-        """Test get_new_videos handles HTTPError"""
-        with patch(
-            "feedparser.parse",
-            side_effect=urllib.error.HTTPError(
-                "url", 404, "Not Found", EmailMessage(), None
-            ),
-        ):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
-
-    def test_get_new_videos_timeout_error(
-        self, youtube_parser_no_init: YoutubeFeedParser
-    ) -> None:
-        """Test get_new_videos handles TimeoutError"""
-        with patch("feedparser.parse", side_effect=TimeoutError("Timeout")):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
-
-    def test_get_new_videos_socket_gaierror(
-        self, youtube_parser_no_init: YoutubeFeedParser
-    ) -> None:
-        """Test get_new_videos handles socket.gaierror"""
-        with patch("feedparser.parse", side_effect=socket.gaierror("DNS error")):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
-
-    def test_get_new_videos_connection_reset(
-        self, youtube_parser_no_init: YoutubeFeedParser
+        fp.ret = make_feed(entries=[make_feed_entry(omit=("author",))])
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 1
+        video_result = result[0]
+        assert video_result is not None
+        assert getattr(video_result, "author", "") == ""
+
+    @pytest.mark.parametrize("make_exception", _NETWORK_ERRORS)
+    def test_get_new_videos_network_errors(
+        self,
+        fp: SimpleNamespace,
+        youtube_parser_no_init: YoutubeFeedParser,
+        make_exception: Callable[[], Exception],
     ) -> None:
-        """Test get_new_videos handles ConnectionResetError"""
-        with patch(
-            "feedparser.parse", side_effect=ConnectionResetError("Connection reset")
-        ):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
+        """Test get_new_videos handles network errors"""
+        fp.exc = make_exception()
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 0
 
     def test_get_new_videos_multiple_videos(
-        self, youtube_parser_no_init: YoutubeFeedParser
+        self,
+        fp: SimpleNamespace,
+        youtube_parser_no_init: YoutubeFeedParser,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test parsing feed with multiple new videos"""
-        entry1 = FeedParserDict()
-        entry1.id = "VIDEO_1"
-        entry1.link = "https://www.youtube.com/watch?v=VIDEO_1"
-        entry1.title = "Video 1"
-        entry1.published = "2025-01-01T00:00:00+00:00"
-        entry1.published_parsed = (2025, 1, 1, 0, 0, 0, 0, 1, 0)
-
-        entry2 = FeedParserDict()
-        entry2.id = "VIDEO_2"
-        entry2.link = "https://www.youtube.com/watch?v=VIDEO_2"
-        entry2.title = "Video 2"
-        entry2.published = "2025-01-02T00:00:00+00:00"
-        entry2.published_parsed = (2025, 1, 2, 0, 0, 0, 0, 1, 0)
-
-        feed = MagicMock(spec=FeedParserDict)
-        feed.bozo = False
-        feed.entries = [entry1, entry2]
-
-        with patch("feedparser.parse", return_value=feed):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 2
-            video_result = result[0]
-            assert video_result is not None
-            assert video_result.id == "VIDEO_1"
-            video_result = result[1]
-            assert video_result is not None
-            assert video_result.id == "VIDEO_2"
-            assert "VIDEO_1" in youtube_parser_no_init.seen_videos
-            assert "VIDEO_2" in youtube_parser_no_init.seen_videos
+        fp.ret = make_feed(entries=[make_entry("VIDEO_1"), make_entry("VIDEO_2")])
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 2
+        video_result = result[0]
+        assert video_result is not None
+        assert video_result.id == "yt:video:VIDEO_1"
+        video_result = result[1]
+        assert video_result is not None
+        assert video_result.id == "yt:video:VIDEO_2"
+        assert "yt:video:VIDEO_1" in youtube_parser_no_init.seen_videos
+        assert "yt:video:VIDEO_2" in youtube_parser_no_init.seen_videos
+
+    @pytest.mark.parametrize("n", [2, 50, 500])
+    def test_get_new_videos_scales(
+        self,
+        fp: SimpleNamespace,
+        youtube_parser_no_init: YoutubeFeedParser,
+        make_feed: Callable[..., SimpleNamespace],
+        n: int,
+    ) -> None:
+        """Test that large feeds are deduplicated against seen_videos in one pass"""
+        fp.ret = make_feed(entries=[make_entry(f"VIDEO_{i}") for i in range(n)])
+
+        assert len(youtube_parser_no_init.get_new_videos()) == n
+        assert len(youtube_parser_no_init.seen_videos) == n
+        # A second pass over the same feed finds nothing new
+        assert youtube_parser_no_init.get_new_videos() == []
 
     def test_get_new_videos_includes_published_parsed(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
+        make_feed: Callable[..., SimpleNamespace],
     ) -> None:
         """Test that get_new_videos includes published_parsed in the result"""
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 1
-            video_result = result[0]
-            assert video_result is not None
-            assert video_result.published_parsed == (
-                2025,
-                1,
-                1,
-                0,
-                0,
-                0,
-                0,
-                1,
-                0,
-            )
+        fp.ret = make_feed()
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 1
+        video_result = result[0]
+        assert video_result is not None
+        assert video_result.published_parsed == (
+            2025,
+            1,
+            1,
+            0,
+            0,
+            0,
+            0,
+            1,
+            0,
+        )
 
     def test_get_new_videos_entry_without_id(
         self,
+        fp: SimpleNamespace,
         youtube_parser_no_init: YoutubeFeedParser,
-        mock_feed_with_entries: MagicMock,
-        mock_feed_entry: FeedParserDict,
+        make_feed: Callable[..., SimpleNamespace],
+        make_feed_entry: Callable[..., FeedParserDict],
     ) -> None:
         """Test parsing entry without `id` attribute"""
-        delattr(mock_feed_entry, "id")
-        with patch("feedparser.parse", return_value=mock_feed_with_entries):
-            result = youtube_parser_no_init.get_new_videos()
-            assert len(result) == 0
+        fp.ret = make_feed(entries=[make_feed_entry(omit=("id",))])
+        result = youtube_parser_no_init.get_new_videos()
+        assert len(result) == 0
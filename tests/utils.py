@@ -1,8 +1,30 @@
 from collections.abc import Awaitable, Callable
 
 import pytest
+from feedparser import FeedParserDict
+
+# Build the MarkDecorator once rather than on every decorated test
+_asyncio_mark = pytest.mark.asyncio
 
 
 def async_test(func: Callable[..., Awaitable[None]]) -> Callable[..., Awaitable[None]]:
     """Wrapper for pytest.mark.asyncio that handles Pyrefly type issues"""
-    return pytest.mark.asyncio(func)  # pyrefly: ignore[56]
+    return _asyncio_mark(func)  # pyrefly: ignore[56]
+
+
+def make_entry(video_id: str, **fields: object) -> FeedParserDict:
+    """
+    Build a feedparser entry for a YouTube video,
+    with any `fields` overriding the defaults
+    """
+    return FeedParserDict(
+        {
+            "id": f"yt:video:{video_id}",
+            "yt_videoid": video_id,
+            "link": f"https://www.youtube.com/watch?v={video_id}",
+            "title": f"Video {video_id}",
+            "published": "2025-01-01T00:00:00+00:00",
+            "published_parsed": (2025, 1, 1, 0, 0, 0, 0, 1, 0),
+        }
+        | fields
+    )